@@ -0,0 +1,25 @@
+"""
+Compiles the Numba kernels ahead of time into a `port_fast` extension module.
+
+port_simulation.py and generate_data.py import `port_fast` when it exists, so new
+processes (for example the run_batch.py workers) do not pay any JIT cost at all.
+Without it they fall back to the cached @njit versions. Requires numba and a C compiler.
+Note that AOT-compiled functions keep the GIL, unlike the @njit(nogil=True) version
+of fast_simulate, so `run_batch.py --threads` gains nothing from them.
+
+    python build_aot.py
+"""
+from numba.pycc import CC
+
+from generate_data import _arrival_times_jit
+from port_simulation import fast_simulate
+
+cc = CC('port_fast')
+
+# Only the signatures used by the shipped scenarios are exported:
+# float64 uniforms for arrival generation and integer minutes for the fast engine.
+cc.export('arrival_times', 'f8[:](f8[:], f8, f8, i8, i8)')(_arrival_times_jit.py_func)
+cc.export('fast_simulate', 'UniTuple(i8[:], 3)(i8[:], i8[:], i8, i8, i8)')(fast_simulate.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -2,6 +2,19 @@ import pandas as pd
 import numpy as np
 import os
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional; without it the vectorized NumPy path is used
+    NUMBA_AVAILABLE = False
+
+try:
+    # Ahead-of-time compiled kernels produced by build_aot.py, if it has been run
+    import port_fast
+except ImportError:
+    port_fast = None
+
 # --- Simulation Parameters ---
 # These are now for the INFLUX scenario
 NUM_SHIPS = 80 # More ships to simulate a busy period
@@ -15,6 +28,37 @@ RANDOM_SEED = 42
 # IMPORTANT: New filename for the new scenario
 FILENAME = "ship_arrivals_influx.csv"
 
+def _arrival_times_numpy(uniforms, normal_interval, influx_interval, influx_start, influx_end):
+    """
+    Turns uniform draws into cumulative exponential arrival times with NumPy.
+    """
+    # Use the high-traffic interval during the influx period, the normal one elsewhere
+    scales = np.full(len(uniforms), normal_interval, dtype=np.float64)
+    scales[influx_start:influx_end] = influx_interval
+    return np.cumsum(-scales * np.log(1.0 - uniforms))
+
+if NUMBA_AVAILABLE:
+    # No fastmath here: reordering the float sums would break parity with the NumPy path
+    @njit(cache=True)
+    def _arrival_times_jit(uniforms, normal_interval, influx_interval, influx_start, influx_end):
+        """
+        Same transform as _arrival_times_numpy, compiled into a single loop.
+        """
+        out = np.empty(uniforms.shape[0])
+        total = 0.0
+        for i in range(uniforms.shape[0]):
+            scale = influx_interval if influx_start <= i < influx_end else normal_interval
+            total += -scale * np.log(1.0 - uniforms[i])
+            out[i] = total
+        return out
+
+    _arrival_times = _arrival_times_jit
+else:
+    _arrival_times = _arrival_times_numpy
+
+if port_fast is not None:
+    _arrival_times = port_fast.arrival_times
+
 def generate_arrival_data(num_ships, normal_interval, influx_interval, influx_start, influx_end, container_mean, container_std_dev, seed):
     """
     Generates ship arrival data with a period of high traffic (influx).
@@ -22,20 +66,19 @@ def generate_arrival_data(num_ships, normal_interval, influx_interval, influx_st
     if num_ships <= 0:
         return pd.DataFrame()
 
-    rng = np.random.RandomState(seed)
-    
-    inter_arrival_times = []
-    for i in range(num_ships):
-        if influx_start <= i < influx_end:
-            # Use the high-traffic interval during the influx period
-            inter_arrival_times.append(rng.exponential(scale=influx_interval))
-        else:
-            # Use the normal interval
-            inter_arrival_times.append(rng.exponential(scale=normal_interval))
+    rng = np.random.default_rng(seed)
 
-    arrival_times = np.cumsum(inter_arrival_times).astype(int)
+    # Inverse-CDF exponential draws from shared uniforms, so the Numba and NumPy
+    # paths produce identical arrival times for the same seed
+    uniforms = rng.random(num_ships)
+    arrival_times = _arrival_times(
+        uniforms, float(normal_interval), float(influx_interval), influx_start, influx_end
+    ).astype(np.int64)
     
-    cargo_containers = np.maximum(10, rng.normal(loc=container_mean, scale=container_std_dev, size=num_ships)).astype(int)
+    # Clip in place at the 10-container floor; int32 is plenty for container counts
+    cargo_containers = rng.normal(loc=container_mean, scale=container_std_dev, size=num_ships)
+    np.clip(cargo_containers, 10, None, out=cargo_containers)
+    cargo_containers = cargo_containers.astype(np.int32)
     ship_ids = range(1, num_ships + 1)
 
     df = pd.DataFrame({
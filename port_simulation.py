@@ -1,6 +1,37 @@
 import simpy
-import pandas as pd
+import csv
 import os
+from collections import deque
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    # Only the pure-Python path (--pypy) works without NumPy and pandas
+    np = pd = None
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional; without it fast_simulate runs as plain Python
+    NUMBA_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    # Unquoted header and os.linesep line endings, as to_csv writes them.
+    # Older pyarrow releases lack quoting_header and use the to_csv fallback.
+    PYARROW_CSV_OPTIONS = pa_csv.WriteOptions(quoting_header='none', eol=os.linesep)
+except (ImportError, TypeError):
+    # pyarrow is optional; CSV output falls back to DataFrame.to_csv
+    pa = pa_csv = None
+
+try:
+    # Ahead-of-time compiled kernels produced by build_aot.py, if it has been run
+    import port_fast
+except ImportError:
+    port_fast = None
 
 # --- Simulation Parameters ---
 NUM_BERTHS = 2
@@ -9,12 +40,24 @@ TIME_TO_UNLOAD_ONE_CONTAINER = 2  # In minutes
 INPUT_FILE = 'ship_arrivals_normal.csv'
 RESULTS_FILE = 'results_normal.csv'
 
-# This list will store dictionaries, each representing a completed ship process
-results_data = []
+# Columns read from the arrivals file and their types, so pandas skips type inference
+ARRIVAL_DTYPES = {
+    'ship_id': 'int32',
+    'arrival_time_minutes': 'int64',
+    'cargo_containers': 'int32'
+}
+
+# Column order of the results files
+RESULT_COLUMNS = [
+    'ship_id', 'cargo_containers', 'time_arrived_port', 'time_docked', 'time_crane_secured',
+    'time_unloading_complete', 'time_departed_port',
+    'wait_time_for_berth', 'wait_time_for_crane', 'turnaround_time'
+]
 
-def ship(env, name, port, arrival_time, cargo_containers):
+def ship(env, name, port, arrival_time, cargo_containers, results):
     """
-    Models the process of a single ship. It records key timestamps during its journey.
+    Models the process of a single ship. It records key timestamps during its journey
+    and appends them to the caller-supplied `results` list when the ship departs.
     """
     # Record the actual arrival time (which might be different from scheduled if sim starts late)
     time_arrived = env.now
@@ -28,14 +71,14 @@ def ship(env, name, port, arrival_time, cargo_containers):
 
     print(f"Time {time_arrived:.2f}: Ship {name} has arrived at the port.")
 
-    with port.berths.request() as berth_request:
-        yield berth_request
+    yield port.berths.acquire()
+    try:
         time_docked = env.now
         ship_data['time_docked'] = time_docked
         print(f"Time {time_docked:.2f}: Ship {name} has docked.")
 
-        with port.cranes.request() as crane_request:
-            yield crane_request
+        yield port.cranes.acquire()
+        try:
             time_crane_secured = env.now
             ship_data['time_crane_secured'] = time_crane_secured
             print(f"Time {time_crane_secured:.2f}: Ship {name} has secured a crane.")
@@ -46,113 +89,394 @@ def ship(env, name, port, arrival_time, cargo_containers):
             time_unloading_complete = env.now
             ship_data['time_unloading_complete'] = time_unloading_complete
             print(f"Time {time_unloading_complete:.2f}: Ship {name} has finished unloading.")
+        finally:
+            port.cranes.release()
             
         print(f"Time {env.now:.2f}: Ship {name} has released the crane.")
+    finally:
+        port.berths.release()
 
     time_departed = env.now
     ship_data['time_departed_port'] = time_departed
     print(f"Time {time_departed:.2f}: Ship {name} is departing.")
     
     # Add the completed ship's data to our results list
-    results_data.append(ship_data)
+    results.append(ship_data)
+
+
+class FastResource:
+    """
+    A minimal first-come-first-served stand-in for simpy.Resource.
+    acquire() returns an event to yield on; release() hands the slot straight to the
+    next waiter. Unlike simpy.Resource there is no per-use Request object or context
+    manager, and waiting processes cannot be interrupted out of the queue.
+    """
+    def __init__(self, env, capacity):
+        if capacity <= 0:
+            # Same check and message as simpy.Resource
+            raise ValueError('"capacity" must be > 0.')
+        self.env = env
+        self.capacity = capacity
+        self.count = 0
+        self.queue = deque()
+
+    def acquire(self):
+        event = self.env.event()
+        if self.count < self.capacity:
+            self.count += 1
+            event.succeed()
+        else:
+            self.queue.append(event)
+        return event
+
+    def release(self):
+        if self.queue:
+            # The slot passes directly to the next waiter, so count is unchanged
+            self.queue.popleft().succeed()
+        elif self.count > 0:
+            # A release without a matching acquire is a no-op, as in simpy.Resource
+            self.count -= 1
 
 
 class Port:
     def __init__(self, env, num_berths, num_cranes):
         self.env = env
-        self.berths = simpy.Resource(env, capacity=num_berths)
-        self.cranes = simpy.Resource(env, capacity=num_cranes)
+        self.berths = FastResource(env, capacity=num_berths)
+        self.cranes = FastResource(env, capacity=num_cranes)
 
 
-def calculate_and_save_results(output_filename):
+def print_kpi_summary(total_ships, avg_berth_wait, max_berth_wait, avg_crane_wait, avg_turnaround):
+    """
+    Prints the KPI summary block shown at the end of every run.
+    """
+    print("\n" + "="*40)
+    print("           PORT PERFORMANCE KPIs")
+    print("="*40)
+    print(f"Total Ships Processed: {total_ships}")
+    print(f"Average Berth Wait Time: {avg_berth_wait:.2f} minutes")
+    print(f"Maximum Berth Wait Time: {max_berth_wait:.2f} minutes")
+    print(f"Average Crane Wait Time: {avg_crane_wait:.2f} minutes")
+    print(f"Average Turnaround Time: {avg_turnaround:.2f} minutes")
+    print("="*40 + "\n")
+
+
+def calculate_and_save_results(results, output_filename, file_format='csv'):
     """
     Processes the simulation results, calculates KPIs, and saves them.
+    `results` maps each output column name to a NumPy array with one entry per ship.
+    With file_format='feather' the results are written as a Feather file next to
+    `output_filename` (same name, .feather extension) instead of CSV.
     """
-    if not results_data:
+    if len(results['ship_id']) == 0:
         print("Warning: Results data is empty. No output file will be generated.")
         return
 
-    # Convert the list of dictionaries to a pandas DataFrame
-    results_df = pd.DataFrame(results_data)
+    # --- Calculate KPIs ---
+    wait_berth = results['time_docked'] - results['time_arrived_port']
+    wait_crane = results['time_crane_secured'] - results['time_docked']
+    turnaround = results['time_departed_port'] - results['time_arrived_port']
+
+    print_kpi_summary(len(wait_berth), wait_berth.mean(), wait_berth.max(), wait_crane.mean(), turnaround.mean())
+
+    columns = dict(results)
+    columns['wait_time_for_berth'] = wait_berth
+    columns['wait_time_for_crane'] = wait_crane
+    columns['turnaround_time'] = turnaround
+
+    # --- Save Detailed Results ---
+    try:
+        if file_format == 'feather':
+            output_filename = os.path.splitext(output_filename)[0] + '.feather'
+            pd.DataFrame(columns).to_feather(output_filename)
+        elif pa_csv is not None and all(np.issubdtype(column.dtype, np.integer) for column in columns.values()):
+            # pyarrow formats the numbers in C, straight from the arrays. Its float
+            # formatting differs from to_csv (56 vs 56.0, no exponent notation), so it is
+            # only used when every column is an integer and the file is byte-identical.
+            pa_csv.write_csv(pa.table(columns), output_filename, write_options=PYARROW_CSV_OPTIONS)
+        else:
+            pd.DataFrame(columns).to_csv(output_filename, index=False)
+        full_path = os.path.abspath(output_filename)
+        print(f"Detailed results saved to '{full_path}'")
+    except ImportError as e:
+        # to_feather needs the optional pyarrow package
+        print(f"Error saving results file: {e}")
+    except IOError as e:
+        print(f"Error saving results file: {e}")
+
+
+def calculate_and_save_results_stdlib(results, output_filename):
+    """
+    Same as calculate_and_save_results for CSV output, using only the standard library.
+    `results` maps each output column name to a list with one entry per ship.
+    """
+    total_ships = len(results['ship_id'])
+    if total_ships == 0:
+        print("Warning: Results data is empty. No output file will be generated.")
+        return
 
     # --- Calculate KPIs ---
-    results_df['wait_time_for_berth'] = results_df['time_docked'] - results_df['time_arrived_port']
-    results_df['wait_time_for_crane'] = results_df['time_crane_secured'] - results_df['time_docked']
-    results_df['turnaround_time'] = results_df['time_departed_port'] - results_df['time_arrived_port']
+    wait_berth = [d - a for d, a in zip(results['time_docked'], results['time_arrived_port'])]
+    wait_crane = [c - d for c, d in zip(results['time_crane_secured'], results['time_docked'])]
+    turnaround = [d - a for d, a in zip(results['time_departed_port'], results['time_arrived_port'])]
 
-    # --- Print KPI Summary to Console ---
-    print("\n" + "="*40)
-    print("           PORT PERFORMANCE KPIs")
-    print("="*40)
-    print(f"Total Ships Processed: {len(results_df)}")
-    print(f"Average Berth Wait Time: {results_df['wait_time_for_berth'].mean():.2f} minutes")
-    print(f"Maximum Berth Wait Time: {results_df['wait_time_for_berth'].max():.2f} minutes")
-    print(f"Average Crane Wait Time: {results_df['wait_time_for_crane'].mean():.2f} minutes")
-    print(f"Average Turnaround Time: {results_df['turnaround_time'].mean():.2f} minutes")
-    print("="*40 + "\n")
+    print_kpi_summary(
+        total_ships, sum(wait_berth) / total_ships, max(wait_berth),
+        sum(wait_crane) / total_ships, sum(turnaround) / total_ships
+    )
 
     # --- Save Detailed Results to CSV ---
+    columns = [results[name] for name in RESULT_COLUMNS[:7]] + [wait_berth, wait_crane, turnaround]
+    # A column holding any float is written entirely as floats, as pandas does,
+    # rather than mixing 56 and 305.0 within one column
+    columns = [
+        [float(value) for value in column] if any(isinstance(value, float) for value in column) else column
+        for column in columns
+    ]
     try:
-        results_df.to_csv(output_filename, index=False)
+        with open(output_filename, 'w', newline='') as f:
+            # Match to_csv's line endings; the csv module defaults to \r\n everywhere
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(RESULT_COLUMNS)
+            writer.writerows(zip(*columns))
         full_path = os.path.abspath(output_filename)
         print(f"Detailed results saved to '{full_path}'")
     except IOError as e:
         print(f"Error saving results file: {e}")
 
 
-def run_simulation(num_berths, num_cranes, unload_time, input_file, results_file):
+def read_arrivals_stdlib(input_file):
+    """
+    Reads the arrivals file with the csv module and returns the ship ids, arrival
+    times and cargo sizes as lists of ints.
+    """
+    ship_ids, arrival_times, cargo = [], [], []
+    with open(input_file, newline='') as f:
+        for row in csv.DictReader(f):
+            ship_ids.append(int(row['ship_id']))
+            arrival_times.append(int(row['arrival_time_minutes']))
+            cargo.append(int(row['cargo_containers']))
+    return ship_ids, arrival_times, cargo
+
+
+def fast_simulate(arrivals, cargo, num_berths, num_cranes, unload_time):
+    """
+    Computes the same timestamps as the SimPy model without an event loop.
+    Both queues are first-come-first-served, so each ship in arrival order simply takes
+    the berth and then the crane that frees up first. Returns the docked,
+    crane-secured and departed times (unloading completes when the ship departs).
+    """
+    n = arrivals.shape[0]
+    docked = np.empty_like(arrivals)
+    crane_secured = np.empty_like(arrivals)
+    departed = np.empty_like(arrivals)
+    berth_free = np.zeros(num_berths, dtype=arrivals.dtype)
+    crane_free = np.zeros(num_cranes, dtype=arrivals.dtype)
+    for i in range(n):
+        b = np.argmin(berth_free)
+        start = max(arrivals[i], berth_free[b])
+        c = np.argmin(crane_free)
+        secured = max(start, crane_free[c])
+        end = secured + cargo[i] * unload_time
+        docked[i] = start
+        crane_secured[i] = secured
+        departed[i] = end
+        berth_free[b] = end
+        crane_free[c] = end
+    return docked, crane_secured, departed
+
+if NUMBA_AVAILABLE:
+    # cache=True keeps the compiled code on disk so new processes skip the JIT step.
+    # No fastmath: it lets LLVM fuse `secured + cargo * unload_time` into an FMA, which
+    # changes the rounding for fractional unload times and breaks parity with SimPy.
+    # nogil=True lets several scenarios run this kernel in parallel threads.
+    fast_simulate = njit(cache=True, nogil=True)(fast_simulate)
+
+
+def _simulate_fast(ship_ids, arrival_times, cargo, num_berths, num_cranes, unload_time, until):
+    """
+    Runs the model with fast_simulate and returns the per-ship result columns.
+    """
+    # Times stay integer when the inputs are integer so the CSV output matches the SimPy engine
+    time_dtype = np.result_type(arrival_times.dtype, type(unload_time))
+    arrivals = arrival_times.astype(time_dtype)
+    # The AOT build only exports the integer-minute signature; anything else uses the JIT version
+    kernel = fast_simulate
+    if port_fast is not None and time_dtype == np.int64:
+        kernel = port_fast.fast_simulate
+    time_docked, time_crane, time_departed = kernel(
+        arrivals, cargo.astype(time_dtype), num_berths, num_cranes, time_dtype.type(unload_time)
+    )
+
+    # Match env.run(until=...): only ships that departed before the end are reported,
+    # in the order they departed
+    done = np.flatnonzero(time_departed < until)
+    done = done[np.argsort(time_departed[done], kind='stable')]
+    return {
+        'ship_id': ship_ids[done],
+        'cargo_containers': cargo[done],
+        # The float copy is only for the kernel; arrivals stay whole minutes, as in SimPy
+        'time_arrived_port': arrival_times[done],
+        'time_docked': time_docked[done],
+        'time_crane_secured': time_crane[done],
+        'time_unloading_complete': time_departed[done],
+        'time_departed_port': time_departed[done]
+    }
+
+
+def _simulate_simpy(ship_ids, arrival_times, cargo, num_berths, num_cranes, unload_time, until, verbose):
+    """
+    Runs the SimPy discrete-event model and returns the per-ship result columns as lists.
+    The inputs may be NumPy arrays or plain lists, so this also serves the pure-Python path.
+    """
+    # Split the schedule into plain Python ints once, before any process starts.
+    # NumPy scalars are slower to do arithmetic on and to format in the event messages.
+    ship_ids, arrival_times, cargo = [
+        column.tolist() if hasattr(column, 'tolist') else [int(value) for value in column]
+        for column in (ship_ids, arrival_times, cargo)
+    ]
+
+    # One preallocated list per timestamp, indexed by the ship's position in the schedule.
+    # Plain lists are cheaper to assign single items into than arrays, on CPython and PyPy alike.
+    num_ships = len(arrival_times)
+    time_arrived, time_docked, time_crane, time_unload, time_departed = [
+        [0] * num_ships for _ in range(5)
+    ]
+    # Positions of ships in the order they departed, so rows keep the same order as before
+    departure_order = []
+
+    env = simpy.Environment()
+    port = Port(env, num_berths, num_cranes)
+
+    # Inner ship function needs access to the unload time per container
+    def ship_process(env, i, name, port, arrival_time, cargo_containers):
+        time_arrived[i] = env.now
+        if verbose:
+            print(f"Time {env.now:.2f}: Ship {name} has arrived.")
+        yield port.berths.acquire()
+        try:
+            time_docked[i] = env.now
+            if verbose:
+                print(f"Time {env.now:.2f}: Ship {name} has docked.")
+            yield port.cranes.acquire()
+            try:
+                time_crane[i] = env.now
+                if verbose:
+                    print(f"Time {env.now:.2f}: Ship {name} has secured a crane.")
+                unloading_duration = cargo_containers * unload_time # Use passed-in parameter
+                yield env.timeout(unloading_duration)
+                time_unload[i] = env.now
+                if verbose:
+                    print(f"Time {env.now:.2f}: Ship {name} has finished unloading.")
+            finally:
+                port.cranes.release()
+            if verbose:
+                print(f"Time {env.now:.2f}: Ship {name} has released the crane.")
+        finally:
+            port.berths.release()
+        time_departed[i] = env.now
+        if verbose:
+            print(f"Time {env.now:.2f}: Ship {name} is departing.")
+        departure_order.append(i)
+
+    # Gaps between consecutive arrivals, computed once up front (arrival times are whole minutes)
+    deltas = [t - p for p, t in zip([0] + arrival_times[:-1], arrival_times)]
+
+    def arrival_process(env, port):
+        for i, delta in enumerate(deltas):
+            yield env.timeout(delta)
+            env.process(ship_process(env, i, ship_ids[i], port, arrival_times[i], cargo[i]))
+
+    env.process(arrival_process(env, port))
+    env.run(until=until)
+
+    # Only ships that departed before the run ended are reported
+    done = departure_order
+    return {
+        'ship_id': [ship_ids[i] for i in done],
+        'cargo_containers': [cargo[i] for i in done],
+        'time_arrived_port': [time_arrived[i] for i in done],
+        'time_docked': [time_docked[i] for i in done],
+        'time_crane_secured': [time_crane[i] for i in done],
+        'time_unloading_complete': [time_unload[i] for i in done],
+        'time_departed_port': [time_departed[i] for i in done]
+    }
+
+
+def run_simulation(num_berths, num_cranes, unload_time, input_file, results_file, verbose=False, engine='simpy', file_format='csv', pure_python=False):
     """
     Sets up and runs the port simulation with configurable parameters.
+    engine='simpy' runs the discrete-event model; engine='fast' computes the same
+    timestamps directly with fast_simulate. Per-ship event messages are only printed
+    by the SimPy engine, and only when verbose is True. file_format is 'csv' or 'feather'.
+    pure_python=True reads and writes CSV with the csv module and never touches pandas
+    or NumPy, which is the fastest way to run the SimPy engine under PyPy.
+    Returns the per-ship result columns, or None if the run could not start.
     """
     print(f"--- Starting Simulation: {results_file} ---")
     print(f"Berths: {num_berths}, Cranes: {num_cranes}\n")
-    
-    global results_data # Use the global results list
-    results_data.clear() # Clear results from any previous run
 
+    if pure_python and (engine != 'simpy' or file_format != 'csv'):
+        print("Error: The pure-Python mode only supports the SimPy engine and CSV output.")
+        return
+    if num_berths < 1 or num_cranes < 1:
+        # Checked here so both engines reject it the same way; fast_simulate would
+        # otherwise fail on argmin of an empty free-time array
+        print("Error: The port needs at least one berth and one crane.")
+        return
+    if not pure_python and pd is None:
+        print("Error: pandas and NumPy are required unless the pure-Python mode (--pypy) is used.")
+        return
+    
     try:
-        arrivals_df = pd.read_csv(input_file)
+        if pure_python:
+            ship_ids, arrival_times, cargo = read_arrivals_stdlib(input_file)
+        else:
+            arrivals_df = pd.read_csv(
+                input_file,
+                usecols=list(ARRIVAL_DTYPES),
+                dtype=ARRIVAL_DTYPES,
+                engine='c'
+            )
     except FileNotFoundError:
         print(f"Error: Input file '{input_file}' not found.")
         return
 
-    env = simpy.Environment()
-    port = Port(env, num_berths, num_cranes)
+    if not pure_python:
+        # Pull the columns out as plain arrays once; iterrows() builds a Series per ship
+        arrival_times = arrivals_df['arrival_time_minutes'].to_numpy()
+        cargo = arrivals_df['cargo_containers'].to_numpy()
+        ship_ids = arrivals_df['ship_id'].to_numpy()
 
-    # Inner ship function needs access to the unload time per container
-    def ship_process(env, name, port, arrival_time, cargo_containers):
-        
-        time_arrived = env.now
-        ship_data = {'ship_id': name, 'cargo_containers': cargo_containers, 'time_arrived_port': time_arrived}
-        print(f"Time {time_arrived:.2f}: Ship {name} has arrived.")
-        with port.berths.request() as berth_request:
-            yield berth_request
-            ship_data['time_docked'] = env.now
-            print(f"Time {env.now:.2f}: Ship {name} has docked.")
-            with port.cranes.request() as crane_request:
-                yield crane_request
-                ship_data['time_crane_secured'] = env.now
-                print(f"Time {env.now:.2f}: Ship {name} has secured a crane.")
-                unloading_duration = cargo_containers * unload_time # Use passed-in parameter
-                yield env.timeout(unloading_duration)
-                ship_data['time_unloading_complete'] = env.now
-                print(f"Time {env.now:.2f}: Ship {name} has finished unloading.")
-            print(f"Time {env.now:.2f}: Ship {name} has released the crane.")
-        ship_data['time_departed_port'] = env.now
-        print(f"Time {env.now:.2f}: Ship {name} is departing.")
-        results_data.append(ship_data)
-
-    def arrival_process(env, port, arrivals_df):
-        for _, row in arrivals_df.iterrows():
-            yield env.timeout(row['arrival_time_minutes'] - env.now)
-            env.process(ship_process(env, row['ship_id'], port, row['arrival_time_minutes'], row['cargo_containers']))
-
-    env.process(arrival_process(env, port, arrivals_df))
-    simulation_runtime = arrivals_df['arrival_time_minutes'].max() + 20000 # More buffer time
-    env.run(until=simulation_runtime)
+    if len(arrival_times) == 0:
+        # No ships means no results; max() would fail on the empty column
+        print("Warning: Results data is empty. No output file will be generated.")
+        return
+
+    # Ships are scheduled in file order. The SimPy engine cannot go back in time and
+    # fast_simulate assumes FIFO order, so both engines reject an unsorted file up front.
+    if pure_python:
+        in_order = all(a <= b for a, b in zip(arrival_times, arrival_times[1:]))
+        simulation_runtime = max(arrival_times) + 20000 # More buffer time
+    else:
+        in_order = bool(np.all(np.diff(arrival_times) >= 0))
+        simulation_runtime = arrival_times.max() + 20000 # More buffer time
+    if not in_order:
+        print(f"Error: Input file '{input_file}' is not sorted by arrival_time_minutes.")
+        return
+
+    if engine == 'fast':
+        results = _simulate_fast(ship_ids, arrival_times, cargo, num_berths, num_cranes, unload_time, simulation_runtime)
+    else:
+        results = _simulate_simpy(ship_ids, arrival_times, cargo, num_berths, num_cranes, unload_time, simulation_runtime, verbose)
+        if not pure_python:
+            results = {name: np.asarray(column) for name, column in results.items()}
     
     print("\n--- Simulation Complete ---")
-    calculate_and_save_results(results_file)
+    if pure_python:
+        calculate_and_save_results_stdlib(results, results_file)
+    else:
+        calculate_and_save_results(results, results_file, file_format)
+    return results
 
 if __name__ == "__main__":
     import argparse
@@ -161,13 +485,21 @@ if __name__ == "__main__":
     parser.add_argument("--cranes", type=int, default=2, help="Number of cranes available.")
     parser.add_argument("--input", type=str, default="ship_arrivals_normal.csv", help="Input CSV file for ship arrivals.")
     parser.add_argument("--output", type=str, default="results_normal.csv", help="Output CSV file for results.")
+    parser.add_argument("--verbose", action="store_true", help="Print every ship event as it happens.")
+    parser.add_argument("--format", choices=["csv", "feather"], default="csv", help="File format for the results; 'feather' replaces the output file's extension with .feather.")
+    parser.add_argument("--engine", choices=["simpy", "fast"], default="simpy", help="'simpy' runs the event simulation; 'fast' computes the same results without it.")
+    parser.add_argument("--pypy", action="store_true", help="Pure-Python mode for PyPy: stdlib csv I/O, no pandas/NumPy (SimPy engine, CSV output only).")
     
     args = parser.parse_args()
 
     run_simulation(
         num_berths=args.berths,
         num_cranes=args.cranes,
-        unload_time=2, # Corresponds to TIME_TO_UNLOAD_ONE_CONTAINER
+        unload_time=TIME_TO_UNLOAD_ONE_CONTAINER,
         input_file=args.input,
-        results_file=args.output
+        results_file=args.output,
+        verbose=args.verbose,
+        engine=args.engine,
+        file_format=args.format,
+        pure_python=args.pypy
     )
\ No newline at end of file
@@ -0,0 +1,44 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from port_simulation import run_simulation, TIME_TO_UNLOAD_ONE_CONTAINER
+
+# --- Scenario Configuration ---
+# Each entry is one independent simulation run; together they produce the
+# result files read by visualize_results.py.
+SCENARIOS = [
+    dict(num_berths=2, num_cranes=2, input_file='ship_arrivals_normal.csv', results_file='results_normal.csv'),
+    dict(num_berths=2, num_cranes=2, input_file='ship_arrivals_influx.csv', results_file='results_influx.csv'),
+    dict(num_berths=2, num_cranes=1, input_file='ship_arrivals_normal.csv', results_file='results_crane_shortage.csv'),
+]
+
+def _run_one(config):
+    """Runs a single scenario. Defined at module level so worker processes can pickle it."""
+    return run_simulation(unload_time=TIME_TO_UNLOAD_ONE_CONTAINER, **config)
+
+def run_batch(configs, workers=None, engine='simpy', file_format='csv', use_threads=False):
+    """
+    Runs every scenario in `configs` in parallel and returns their results in the
+    same order. By default each scenario gets its own process. With use_threads=True
+    they share one process instead, which avoids starting and pickling to workers;
+    this only runs in parallel with engine='fast', whose compiled kernel releases the GIL.
+    """
+    configs = [dict(config, engine=engine, file_format=file_format) for config in configs]
+    executor_cls = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with executor_cls(max_workers=workers) as executor:
+        return list(executor.map(_run_one, configs))
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Run all port congestion scenarios in parallel")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes (or threads with --threads).")
+    parser.add_argument("--engine", choices=["simpy", "fast"], default="simpy", help="Simulation engine passed to run_simulation.")
+    parser.add_argument("--format", choices=["csv", "feather"], default="csv", help="File format for the result files.")
+    parser.add_argument("--threads", action="store_true", help="Use threads instead of processes (only parallel with --engine fast).")
+
+    args = parser.parse_args()
+
+    run_batch(SCENARIOS, workers=args.workers, engine=args.engine, file_format=args.format, use_threads=args.threads)
+
+if __name__ == "__main__":
+    main()
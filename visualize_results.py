@@ -3,8 +3,12 @@ import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
+import numpy as np
 import os
 
+# Set a professional plot style (once, at import)
+sns.set_theme(style="whitegrid")
+
 # --- Configuration ---
 # A dictionary mapping the file names to the names we want in our plot legends.
 RESULT_FILES = {
@@ -13,18 +17,39 @@ RESULT_FILES = {
     'Crane Shortage': 'results_crane_shortage.csv'
 }
 
+# Known column types of the result files, so pandas skips type inference.
+# Timestamps are read as floats since they are fractional when unload times are.
+RESULT_DTYPES = {
+    'ship_id': np.int32,
+    'cargo_containers': np.int32,
+    'time_arrived_port': np.float64,
+    'time_docked': np.float64,
+    'time_crane_secured': np.float64,
+    'time_unloading_complete': np.float64,
+    'time_departed_port': np.float64,
+    'wait_time_for_berth': np.float64,
+    'wait_time_for_crane': np.float64,
+    'turnaround_time': np.float64
+}
+
 # Create a directory to save the plots, if it doesn't already exist.
 PLOTS_DIR = 'plots'
 if not os.path.exists(PLOTS_DIR):
     os.makedirs(PLOTS_DIR)
 
 def load_all_results(files_dict):
-    """Loads multiple result CSVs into a single DataFrame."""
+    """Loads multiple result files (CSV or .feather) into a single DataFrame."""
     all_data = []
-    for scenario_name, file_path in files_dict.items():
+    # The scenario column is categorical: one small code per row instead of a string
+    scenario_names = list(files_dict)
+    for code, (scenario_name, file_path) in enumerate(files_dict.items()):
         try:
-            df = pd.read_csv(file_path)
-            df['scenario'] = scenario_name  # Add a column to identify the scenario
+            if file_path.endswith('.feather'):
+                df = pd.read_feather(file_path)
+            else:
+                df = pd.read_csv(file_path, dtype=RESULT_DTYPES, engine='c')
+            # Add a column to identify the scenario
+            df['scenario'] = pd.Categorical.from_codes(np.full(len(df), code), categories=scenario_names)
             all_data.append(df)
         except FileNotFoundError:
             print(f"Warning: Result file not found at '{file_path}'. Skipping.")
@@ -32,7 +57,11 @@ def load_all_results(files_dict):
     if not all_data:
         return pd.DataFrame() # Return empty df if no files were found
         
-    return pd.concat(all_data, ignore_index=True)
+    # Frames share the same categories, so concat keeps the categorical dtype.
+    # Scenarios whose files were missing are dropped so they don't show up as empty plot slots.
+    results_df = pd.concat(all_data, ignore_index=True)
+    results_df['scenario'] = results_df['scenario'].cat.remove_unused_categories()
+    return results_df
 
 def create_and_save_plots(results_df):
     """Generates and saves all the comparison plots."""
@@ -43,53 +72,57 @@ def create_and_save_plots(results_df):
 
     print("Generating and saving plots...")
 
-    # Set a professional plot style
-    sns.set_theme(style="whitegrid")
+    # All three plots are drawn on one reused figure, cleared between saves,
+    # so matplotlib only sets up a figure and canvas once
+    fig, ax = plt.subplots(figsize=(10, 6))
 
     # --- Plot 1: Average Wait Times (Bar Chart) ---
-    avg_times = results_df.groupby('scenario')[['wait_time_for_berth', 'wait_time_for_crane']].mean().reset_index()
+    avg_times = results_df.groupby('scenario', observed=True)[['wait_time_for_berth', 'wait_time_for_crane']].mean().reset_index()
     avg_times_melted = avg_times.melt(id_vars='scenario', var_name='wait_type', value_name='average_minutes')
     
-    plt.figure(figsize=(10, 6))
-    barplot = sns.barplot(data=avg_times_melted, x='scenario', y='average_minutes', hue='wait_type')
-    plt.title('Average Wait Times by Scenario', fontsize=16)
-    plt.ylabel('Average Wait Time (minutes)')
-    plt.xlabel('Scenario')
-    plt.legend(title='Wait Type', labels=['Berth Wait', 'Crane Wait'])
+    sns.barplot(data=avg_times_melted, x='scenario', y='average_minutes', hue='wait_type', ax=ax)
+    ax.set_title('Average Wait Times by Scenario', fontsize=16)
+    ax.set_ylabel('Average Wait Time (minutes)')
+    ax.set_xlabel('Scenario')
+    handles, _ = ax.get_legend_handles_labels()
+    ax.legend(handles, ['Berth Wait', 'Crane Wait'], title='Wait Type')
     # Add text labels on bars
-    for p in barplot.patches:
-        barplot.annotate(f"{p.get_height():.0f}", 
-                         (p.get_x() + p.get_width() / 2., p.get_height()), 
-                         ha = 'center', va = 'center', 
-                         xytext = (0, 9), 
-                         textcoords = 'offset points')
-    plt.savefig(os.path.join(PLOTS_DIR, 'average_wait_times.png'))
-    plt.close() # Close the plot to free memory
+    for container in ax.containers:
+        ax.bar_label(container, fmt='%.0f', padding=3)
+    fig.savefig(os.path.join(PLOTS_DIR, 'average_wait_times.png'))
 
     # --- Plot 2: Distribution of Turnaround Times (Box Plot) ---
-    plt.figure(figsize=(10, 6))
-    sns.boxplot(data=results_df, x='scenario', y='turnaround_time')
-    plt.title('Distribution of Ship Turnaround Times by Scenario', fontsize=16)
-    plt.ylabel('Turnaround Time (minutes)')
-    plt.xlabel('Scenario')
-    plt.savefig(os.path.join(PLOTS_DIR, 'turnaround_time_distribution.png'))
-    plt.close()
+    ax.clear()
+    sns.boxplot(data=results_df, x='scenario', y='turnaround_time', ax=ax)
+    ax.set_title('Distribution of Ship Turnaround Times by Scenario', fontsize=16)
+    ax.set_ylabel('Turnaround Time (minutes)')
+    ax.set_xlabel('Scenario')
+    fig.savefig(os.path.join(PLOTS_DIR, 'turnaround_time_distribution.png'))
     
     # --- Plot 3: Wait Time for Berth (Box Plot) ---
-    plt.figure(figsize=(10, 6))
-    sns.boxplot(data=results_df, x='scenario', y='wait_time_for_berth')
-    plt.title('Distribution of Berth Wait Times by Scenario', fontsize=16)
-    plt.ylabel('Wait Time for Berth (minutes)')
-    plt.xlabel('Scenario')
-    plt.savefig(os.path.join(PLOTS_DIR, 'berth_wait_time_distribution.png'))
-    plt.close()
+    ax.clear()
+    sns.boxplot(data=results_df, x='scenario', y='wait_time_for_berth', ax=ax)
+    ax.set_title('Distribution of Berth Wait Times by Scenario', fontsize=16)
+    ax.set_ylabel('Wait Time for Berth (minutes)')
+    ax.set_xlabel('Scenario')
+    fig.savefig(os.path.join(PLOTS_DIR, 'berth_wait_time_distribution.png'))
+    plt.close(fig) # Close the figure to free memory
     
     print(f"Successfully saved 3 plots to the '{PLOTS_DIR}' directory.")
 
 
 def main():
     """Main function to run the visualization script."""
-    all_results_df = load_all_results(RESULT_FILES)
+    import argparse
+    parser = argparse.ArgumentParser(description="Plot port congestion scenario results")
+    parser.add_argument("--format", choices=["csv", "feather"], default="csv", help="File format of the result files to read.")
+    args = parser.parse_args()
+
+    result_files = RESULT_FILES
+    if args.format == 'feather':
+        result_files = {name: os.path.splitext(path)[0] + '.feather' for name, path in RESULT_FILES.items()}
+
+    all_results_df = load_all_results(result_files)
     create_and_save_plots(all_results_df)
 
 if __name__ == "__main__":